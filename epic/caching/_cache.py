@@ -2,10 +2,9 @@ import os
 import threading
 
 from typing import TypeVar, Any
-from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import nullcontext, AbstractContextManager
 from abc import ABCMeta, abstractmethod
-from collections.abc import MutableMapping, Iterator, Hashable
+from collections.abc import MutableMapping, Iterator, Hashable, Callable
 
 
 KT = TypeVar("KT", bound=Hashable)
@@ -32,9 +31,8 @@ class Cache(MutableMapping[KT, VT], metaclass=ABCMeta):
     def __iter__(self) -> Iterator[KT]:
         return iter(self.cache)
 
-    @contextmanager
-    def lock(self, key: KT):
-        yield
+    def lock(self, key: KT) -> AbstractContextManager:
+        return nullcontext()
 
 
 class ThreadCache(Cache[KT, VT]):
@@ -44,35 +42,36 @@ class ThreadCache(Cache[KT, VT]):
         super().__init__(self.STORE.__dict__.setdefault(name, {}))
 
 
+def _ensure(store: MutableMapping[str, VT], name: str, builder: Callable[[], VT]) -> VT:
+    """
+    Get `store[name]`, creating it with `builder` if missing.
+    Concurrent callers may all build a value, but setdefault (atomic for a dict) makes sure they all get the same one.
+    """
+    value = store.get(name)
+    if value is None:
+        value = store.setdefault(name, builder())
+    return value
+
+
 class ProcessCache(Cache[KT, VT]):
-    STORE_LOCK = threading.Lock()
     STORE_NAME = f'_cache_store_{os.getpid()}'
 
-    def __init__(self, name: str, host: MutableMapping[str, Any] | None = None, n_locks: int = 0):
-        self.n_locks = max(int(n_locks), 0)
+    DEFAULT_N_LOCKS = 64
+
+    def __init__(self, name: str, host: MutableMapping[str, Any] | None = None, n_locks: int = DEFAULT_N_LOCKS):
+        n_locks = int(n_locks)
+        if n_locks <= 0:
+            n_locks = self.DEFAULT_N_LOCKS
+        # Round up to a power of two, so that a lock can be selected by masking the hash
+        n_locks = 1 << (n_locks - 1).bit_length()
         if host is None:
             host = globals()
-        if self.STORE_NAME not in host:
-            with self.STORE_LOCK:
-                # Must check again, after the lock
-                if self.STORE_NAME not in host:
-                    host[self.STORE_NAME] = {}
-        cache_store: dict[str, tuple[dict[KT, VT], Any]] = host[self.STORE_NAME]
-        if name not in cache_store:
-            with self.STORE_LOCK:
-                if name not in cache_store:
-                    cache_store[name] = (
-                        {},
-                        [threading.Lock() for _ in range(self.n_locks)] or defaultdict(threading.Lock),
-                    )
-        cache, self.locks = cache_store[name]
+        cache_store: dict[str, tuple[dict[KT, VT], list[threading.Lock]]] = _ensure(host, self.STORE_NAME, dict)
+        cache, self.locks = _ensure(cache_store, name, lambda: ({}, [threading.Lock() for _ in range(n_locks)]))
+        # The locks may have been created by an earlier instance, with a different number of locks
+        self.n_locks = len(self.locks)
+        self._lock_mask = self.n_locks - 1
         super().__init__(cache)
 
-    @contextmanager
-    def lock(self, key: KT):
-        try:
-            with self.locks[hash(key) % self.n_locks if self.n_locks else key]:
-                yield
-        finally:
-            if not self.n_locks and key not in self.cache:
-                del self.locks[key]
+    def lock(self, key: KT) -> AbstractContextManager:
+        return self.locks[hash(key) & self._lock_mask]
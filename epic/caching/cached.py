@@ -1,8 +1,11 @@
 import inspect
+import threading
 
+from types import MethodType
 from functools import partial
+from weakref import WeakKeyDictionary
 from decorator import decorator
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from typing import TypeVar, ParamSpec, Concatenate, Literal, Any
 
 from epic.common.general import hash_content
@@ -14,29 +17,144 @@ T = TypeVar('T')
 P = ParamSpec('P')
 Scope = Literal['thread', 'process']
 
+_SCOPE_FACTORIES: dict[str, Callable[[str], Cache]] = {
+    'thread': ThreadCache,
+    'process': partial(ProcessCache, n_locks=128),
+}
+_CACHES: dict[tuple[str, str], Cache] = {}
+_CACHES_LOCK = threading.Lock()
+_THREAD_CACHES = threading.local()
+# Types which are hashed directly, without going through `hash_content`
+_ATOMIC_TYPES = frozenset({int, float, complex, str, bytes, bool, type(None)})
+_SIGNATURES: WeakKeyDictionary[Callable, inspect.Signature] = WeakKeyDictionary()
+_KEY_MAKERS: WeakKeyDictionary[Callable, Callable[..., tuple] | None] = WeakKeyDictionary()
+_PLAIN_KINDS = frozenset({inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD})
+
+
+def _memoize(table: WeakKeyDictionary[Callable, T], fn: Callable, compute: Callable[[Callable], T]) -> T:
+    try:
+        return table[fn]
+    except KeyError:
+        value = table[fn] = compute(fn)
+    except TypeError:
+        # Not hashable or not weakly referenceable, must compute on each call
+        value = compute(fn)
+    return value
+
+
+def _make_key_maker(fn: Callable) -> Callable[..., tuple] | None:
+    """
+    Generate a function with the same parameters as `fn`, returning the items of the bound arguments.
+    This lets the interpreter do the binding, instead of `inspect.Signature.bind`.
+
+    Only possible if all parameters are positional or keyword ones, without defaults (which are not
+    included in the bound arguments). Otherwise, returns None.
+    """
+    params = _memoize(_SIGNATURES, fn, inspect.signature).parameters.values()
+    if not all(p.kind in _PLAIN_KINDS and p.default is p.empty for p in params):
+        return None
+    names = [p.name for p in params]
+    signature = names.copy()
+    if n_positional_only := sum(p.kind is inspect.Parameter.POSITIONAL_ONLY for p in params):
+        signature.insert(n_positional_only, '/')
+    items = ''.join(f'({name!r}, {name}), ' for name in names)
+    namespace = {}
+    exec(f"def make_key({', '.join(signature)}):\n    return ({items})\n", {}, namespace)
+    return namespace['make_key']
+
+
+def _get_cache(scope: Scope, name: str) -> Cache:
+    # A ThreadCache is bound to the thread which created it, so those are kept per thread
+    instances = _THREAD_CACHES.__dict__ if scope == 'thread' else _CACHES
+    key = scope, name
+    cache = instances.get(key)
+    if cache is None:
+        try:
+            factory = _SCOPE_FACTORIES[scope]
+        except KeyError:
+            raise ValueError(f"Invalid scope '{scope}'") from None
+        with _CACHES_LOCK:
+            # Must check again, after the lock
+            cache = instances.get(key)
+            if cache is None:
+                cache = instances[key] = factory(name)
+    return cache
+
+
+class _HashedKey(list):
+    # The arguments of a call, as a cache key. The hash is calculated only once, since the key is hashed
+    # several times during a lookup. Similar to `functools._HashedSeq` (tuples cannot hold extra attributes).
+    __slots__ = ('hash_value',)
+
+    def __init__(self, items: tuple):
+        self.hash_value = hash(items)
+        super().__init__(items)
+
+    def __hash__(self) -> int:
+        return self.hash_value
+
+
+def _hash_arguments(arguments: Iterable[tuple[str | int, Any]]) -> int:
+    # Hash each distinct argument object only once, even if it is passed to several parameters
+    memo: dict[int, int] = {}
+    hashes = []
+    for name, value in arguments:
+        if type(value) in _ATOMIC_TYPES:
+            hashes.append((name, hash(value)))
+            continue
+        object_id = id(value)
+        value_hash = memo.get(object_id)
+        if value_hash is None:
+            value_hash = memo[object_id] = hash_content(value)
+        hashes.append((name, value_hash))
+    # Bound arguments are ordered by the signature, so there is no need for an order-insensitive hash
+    return hash(tuple(hashes))
+
 
 def _cached_call_impl(
         scope: Scope,
         name: str,
+        canonicalize: bool,
         callfunc: Callable[P, T],
         init_method: Callable[Concatenate[Any, P], T] | None,
         *args: P.args,
         **kwargs: P.kwargs,
 ) -> T:
-    match scope:
-        case 'thread':
-            cache_class = ThreadCache
-        case 'process':
-            cache_class = partial(ProcessCache, n_locks=100)
-        case _:
-            raise ValueError(f"Invalid scope '{scope}'")
-    if init_method is None:
-        bound_args = inspect.signature(callfunc).bind(*args, **kwargs)
+    # Resolve the cache first, so that an invalid scope is reported before any argument binding
+    cache: Cache[Hashable, T] = _get_cache(scope, name)
+    if canonicalize:
+        if init_method is None:
+            sig_func, sig_args = callfunc, args
+        else:
+            # Add an extra argument for 'self'
+            sig_func, sig_args = init_method, (None, *args)
+        arguments = None
+        key_func, key_args, n_skipped = sig_func, sig_args, 0
+        if isinstance(sig_func, MethodType):
+            # A bound method is created anew on each access, so it would never stay in the memo. Use its function
+            # instead, with the bound object as an extra first argument, which is not part of the key.
+            # This requires the bound object to be bound to the first parameter of the function on its own.
+            params = _memoize(_SIGNATURES, sig_func.__func__, inspect.signature).parameters.values()
+            if (first := next(iter(params), None)) is not None and first.kind in _PLAIN_KINDS:
+                key_func, key_args, n_skipped = sig_func.__func__, (sig_func.__self__, *sig_args), 1
+        if (make_key := _memoize(_KEY_MAKERS, key_func, _make_key_maker)) is not None:
+            try:
+                arguments = make_key(*key_args, **kwargs)[n_skipped:]
+            except TypeError:
+                # An invalid call, let `bind` raise the appropriate error
+                pass
+        if arguments is None:
+            sig = _memoize(_SIGNATURES, key_func, inspect.signature)
+            arguments = tuple(sig.bind(*key_args, **kwargs).arguments.items())[n_skipped:]
     else:
-        # Add an extra argument for 'self'
-        bound_args = inspect.signature(init_method).bind(None, *args, **kwargs)
-    key = hash_content(bound_args.arguments)
-    cache: Cache[int, T] = cache_class(name)
+        # Positional arguments are keyed by their position, keyword arguments by their name
+        arguments = *enumerate(args), *sorted(kwargs.items())
+    # When possible, the arguments themselves are the key, so that colliding hashes cannot mix up entries
+    try:
+        key: Hashable = _HashedKey(arguments)
+    except TypeError:
+        # Some arguments are not hashable, hash them by their content
+        key = _hash_arguments(arguments)
     if key not in cache:
         with cache.lock(key):
             if key not in cache:
@@ -45,7 +163,7 @@ def _cached_call_impl(
 
 
 def cached_call(callable_obj: Callable[P, T], *args: P.args, scope: Scope = 'process',
-                cache_name: str | None = None, **kwargs: P.kwargs) -> T:
+                cache_name: str | None = None, canonicalize: bool = True, **kwargs: P.kwargs) -> T:
     """
     Call an object and get the same object for repeated calls with the same arguments.
 
@@ -62,6 +180,11 @@ def cached_call(callable_obj: Callable[P, T], *args: P.args, scope: Scope = 'pro
     cache_name : string (optional)
         Unique name for the cache used. Default is the name of the callable.
 
+    canonicalize : bool, default True
+        Whether to bind the arguments to the signature of the callable before using them as the key.
+        If True, equivalent calls (e.g. `f(1)` and `f(x=1)`) share the same cached value.
+        If False, the key is made of the arguments as given, which is faster but treats such calls as distinct.
+
     *args, **kwargs :
         Sent to the callable object.
         These are the values determining the key to the cache.
@@ -71,12 +194,14 @@ def cached_call(callable_obj: Callable[P, T], *args: P.args, scope: Scope = 'pro
     object
         The return value of the calling `callable_obj` with `args` and `kwargs`.
     """
-    return _cached_call_impl(scope, cache_name or callable_obj.__name__, callable_obj, None, *args, **kwargs)
+    return _cached_call_impl(
+        scope, cache_name or callable_obj.__name__, canonicalize, callable_obj, None, *args, **kwargs,
+    )
 
 
 @decorator
 def cached(callable_obj: Callable[P, T], scope: Scope = 'process', cache_name: str | None = None,
-           *args: P.args, **kwargs: P.kwargs) -> T:
+           canonicalize: bool = True, *args: P.args, **kwargs: P.kwargs) -> T:
     """
     A decorator version of `cached_call`.
     Mark a callable as cached, based on the arguments of the call.
@@ -94,6 +219,11 @@ def cached(callable_obj: Callable[P, T], scope: Scope = 'process', cache_name: s
     cache_name : string (optional)
         Unique name for the cache used. Default is the name of the callable.
 
+    canonicalize : bool, default True
+        Whether to bind the arguments to the signature of the callable before using them as the key.
+        Since the decorated function already binds its arguments to its signature, equivalent calls share
+        the same cached value either way, and False only saves the additional binding.
+
     *args, **kwargs :
         Sent to the callable object.
         These are the values determining the key to the cache.
@@ -106,7 +236,7 @@ def cached(callable_obj: Callable[P, T], scope: Scope = 'process', cache_name: s
     -----
     Do NOT use as a class decorator. Instead, use the `Cached` metaclass.
     """
-    return cached_call(callable_obj, scope=scope, cache_name=cache_name, *args, **kwargs)
+    return cached_call(callable_obj, scope=scope, cache_name=cache_name, canonicalize=canonicalize, *args, **kwargs)
 
 
 class Cached(type):
@@ -121,6 +251,11 @@ class Cached(type):
         If "thread", there is a different cache for each thread.
         If "process", there is a single global cache, shared by all threads.
 
+    canonicalize : bool, default True
+        Whether to bind the initialization arguments to the signature of `__init__` before using them as the key.
+        If True, equivalent calls (e.g. `MyClass(1)` and `MyClass(x=1)`) return the same object.
+        If False, the key is made of the arguments as given, which is faster but treats such calls as distinct.
+
     Examples
     --------
     Parameters to a metaclass should be provided as keyword arguments when stating the metaclass:
@@ -132,9 +267,14 @@ class Cached(type):
     def __new__(mcs, name, bases, attrs, **kwargs):
         return super().__new__(mcs, name, bases, attrs)
 
-    def __init__(cls, name, bases, attrs, scope: Scope = 'process'):
+    def __init__(cls, name, bases, attrs, scope: Scope = 'process', canonicalize: bool = True):
         super().__init__(name, bases, attrs)
+        if scope not in _SCOPE_FACTORIES:
+            raise ValueError(f"Invalid scope '{scope}'")
         cls._cache_scope = scope
+        cls._cache_canonicalize = canonicalize
 
     def __call__(cls, *args, **kwargs):
-        return _cached_call_impl(cls._cache_scope, cls.__name__, super().__call__, cls.__init__, *args, **kwargs)
+        return _cached_call_impl(
+            cls._cache_scope, cls.__name__, cls._cache_canonicalize, super().__call__, cls.__init__, *args, **kwargs,
+        )
@@ -1,37 +1,56 @@
 import os
+import operator
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import TypeVar, Generic, Callable, overload, Any
 
 from epic.common.io import pload, pdump
 
-from ._cache import ProcessCache, KT, VT
+from ._cache import ProcessCache, KT, VT, _ensure
 
 
 OC = TypeVar('OC', bound="_OwnedCache")
 
+# Prefixes of the keys under which a cached_property keeps, in the owner's __dict__,
+# its cached value and its lock, respectively
+_VALUE_PREFIX = '__cp_'
+_LOCK_PREFIX = '__cpl_'
+
 
 class _OwnedCache(Generic[KT, VT]):
+    __slots__ = ('store', 'slot', 'mutex', 'key')
+
     def __init__(self, owner, key: KT):
-        self.cache = ProcessCache[KT, VT]('property_cache', owner.__dict__)
+        # A property's calculation may access other properties of the owner (e.g. its dependencies),
+        # so properties must not share locks. Each has its own, kept next to its value.
+        self.store = owner.__dict__
+        self.slot = f'{_VALUE_PREFIX}{key}'
+        self.mutex = _ensure(self.store, f'{_LOCK_PREFIX}{key}', threading.Lock)
         self.key = key
 
     def retrieve(self) -> VT:
-        return self.cache[self.key]
+        try:
+            return self.store[self.slot]
+        except KeyError:
+            raise KeyError(self.key) from None
 
     def insert(self, item: VT) -> None:
-        self.cache[self.key] = item
+        self.store[self.slot] = item
 
-    def clear(self) -> None:
-        if self.key in self.cache:
-            del self.cache[self.key]
+    def clear_memory(self) -> None:
+        self.store.pop(self.slot, None)
+
+    def clear_persistent(self) -> None:
+        # Clears any storage other than memory; may be called without holding the lock
+        pass
 
     def full(self) -> bool:
-        return self.key in self.cache
+        return self.slot in self.store
 
     @contextmanager
     def lock(self: OC) -> Iterator[OC]:
-        with self.cache.lock(self.key):
+        with self.mutex:
             yield self
 
 
@@ -91,10 +110,13 @@ class cached_property(Generic[T_contra, T_co]):
             # either decorator mode, or an empty decorator factory
             self.function = method_or_dependency
         self.dependencies = frozenset(dependencies)
+        self._dep_getter = operator.attrgetter(*self.dependencies) if self.dependencies else None
+        self._slot = None if self.function is None else _VALUE_PREFIX + self.name
 
     def __call__(self: CP, func: Callable[[T_contra], T_co]) -> CP:
         """Decorate a method."""
         self.function = func
+        self._slot = _VALUE_PREFIX + self.name
         return self
 
     @property
@@ -106,6 +128,7 @@ class cached_property(Generic[T_contra, T_co]):
         return self.function.__name__
 
     def get_cache(self, owner: T_contra) -> _OwnedCache[str, tuple[tuple, T_co]]:
+        # Not kept in the owner's __dict__, since it refers to that dict and would create a reference cycle
         return _OwnedCache(owner, self.name)
 
     @staticmethod
@@ -150,23 +173,36 @@ class cached_property(Generic[T_contra, T_co]):
             state = owner.__dict__
         else:
             raise RuntimeError(f"Cannot get state of {owner}")
-        if isinstance(state, dict) and ProcessCache.STORE_NAME in state:
-            state = state.copy()
-            del state[ProcessCache.STORE_NAME]
+        if isinstance(state, dict):
+            state = {
+                k: v for k, v in state.items()
+                if k != ProcessCache.STORE_NAME
+                and not (isinstance(k, str) and k.startswith((_VALUE_PREFIX, _LOCK_PREFIX)))
+            }
         return state
 
     def dependency_values(self, owner: T_contra) -> tuple:
-        return tuple(getattr(owner, x) for x in self.dependencies)
+        if self._dep_getter is None:
+            return ()
+        values = self._dep_getter(owner)
+        # With a single attribute, attrgetter returns the value itself rather than a tuple
+        return values if len(self.dependencies) > 1 else (values,)
 
     def is_cache_valid(self, owner: T_contra) -> bool:
         """Test whether the current values of the dependencies match those stored in the cache."""
-        cache = self.get_cache(owner)
-        if not cache.full():
-            return False
-        with cache.lock():
+        # An entry in memory is replaced as a whole, so it can be read without the lock
+        entry = owner.__dict__.get(self._slot)
+        if entry is None:
+            # The entry may still be in a secondary storage, which must be read under the lock
+            cache = self.get_cache(owner)
             if not cache.full():
                 return False
-            return cache.retrieve()[0] == self.dependency_values(owner)
+            with cache.lock():
+                try:
+                    entry = cache.retrieve()
+                except KeyError:
+                    return False
+        return entry[0] == self.dependency_values(owner)
 
     @overload
     def __get__(self: CP, owner: None, owner_type) -> CP: ...
@@ -180,8 +216,14 @@ class cached_property(Generic[T_contra, T_co]):
         # Must get the dependency values before the lock, since the dependencies could
         # themselves be cached properties.
         dep_values = self.dependency_values(owner)
+        entry = owner.__dict__.get(self._slot)
+        if entry is not None and entry[0] == dep_values:
+            return entry[1]
         with self.get_cache(owner).lock() as cache:
-            cached_dep_values, result = cache.retrieve() if cache.full() else (None, None)
+            try:
+                cached_dep_values, result = cache.retrieve()
+            except KeyError:
+                cached_dep_values, result = None, None
             if dep_values != cached_dep_values:
                 result = self.function(owner)
                 cache.insert((dep_values, result))
@@ -196,42 +238,62 @@ class cached_property(Generic[T_contra, T_co]):
         """Clear the cache."""
         cache = self.get_cache(owner)
         if cache.full():
+            # This may involve I/O, so it is done before taking the lock
+            cache.clear_persistent()
             with cache.lock():
-                cache.clear()
+                cache.clear_memory()
 
 
 class _OwnedPicklerCache(_OwnedCache[KT, VT]):
+    __slots__ = ('owner', 'parent', '_file_state')
+
     def __init__(self, owner: T_contra, key: KT, parent: "pickled_cached_property[T_contra, Any]"):
         super().__init__(owner, key)
         self.owner = owner
         self.parent = parent
+        # Whether the file exists, once known. A new instance is created for each operation on the property,
+        # so this only saves repeated checks within that operation.
+        self._file_state: bool | None = None
 
     @property
     def filename(self) -> str:
         return self.parent.get_filename(self.owner)
 
+    def _file_exists(self) -> bool:
+        if self._file_state is None:
+            self._file_state = os.path.exists(self.filename)
+        return self._file_state
+
     def retrieve(self) -> VT:
         if super().full():
             return super().retrieve()
-        filename = self.filename
-        if os.path.exists(filename):
-            item = pload(filename)
-            super().insert(item)
-            return item
+        if self._file_exists():
+            try:
+                item = pload(self.filename)
+            except FileNotFoundError:
+                # The file is removed outside the lock, so it may disappear after being found
+                self._file_state = False
+            else:
+                super().insert(item)
+                return item
         raise KeyError(self.key)
 
     def insert(self, item: VT) -> None:
         super().insert(item)
         pdump(item, self.filename)
+        self._file_state = True
 
-    def clear(self) -> None:
-        filename = self.filename
-        if os.path.exists(filename):
-            os.remove(filename)
-        super().clear()
+    def clear_persistent(self) -> None:
+        if self._file_exists():
+            try:
+                os.remove(self.filename)
+            except FileNotFoundError:
+                # Already removed by someone else
+                pass
+        self._file_state = False
 
     def full(self) -> bool:
-        return super().full() or os.path.exists(self.filename)
+        return super().full() or self._file_exists()
 
 
 # noinspection PyPep8Naming
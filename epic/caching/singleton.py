@@ -1,3 +1,5 @@
+import threading
+
 from typing import TypeVar
 
 
@@ -17,8 +19,13 @@ class Singleton(type):
     def __init__(cls, name, bases, attrs):
         super().__init__(name, bases, attrs)
         cls._instance = None
+        cls._instance_lock = threading.Lock()
 
     def __call__(cls: type[T], *args, **kwargs) -> T:
-        if cls._instance is None:
-            cls._instance = super().__call__(*args, **kwargs)
+        if (instance := cls._instance) is not None:
+            return instance
+        with cls._instance_lock:
+            # Must check again, after the lock
+            if cls._instance is None:
+                cls._instance = super().__call__(*args, **kwargs)
         return cls._instance
@@ -1,7 +1,12 @@
+import abc
+import gc
+import inspect
 import os
+import time
 import pytest
 import random
 import operator
+import weakref
 import threading
 from functools import partial
 
@@ -16,6 +21,7 @@ from epic.caching import (
     pickled_cached_property,
     lazy_property,
 )
+from epic.caching._cache import ProcessCache
 
 
 def test_singleton():
@@ -29,6 +35,29 @@ def test_singleton():
         assert SingletonClass(v) is instance
 
 
+def test_singleton_concurrent_creation():
+    class SlowSingleton(metaclass=Singleton):
+        def __init__(self):
+            time.sleep(0.05)
+
+    instances = []
+    threads = [threading.Thread(target=lambda: instances.append(SlowSingleton())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(instance is instances[0] for instance in instances)
+
+
+def test_process_cache_lock_count():
+    ProcessCache('test_lock_count', n_locks=4)
+    cache = ProcessCache('test_lock_count', n_locks=128)
+    assert cache.n_locks == 4
+    for key in range(1000):
+        with cache.lock(key):
+            pass
+
+
 class TestCached:
     all_scopes = pytest.mark.parametrize("scope,op", [('process', operator.is_), ('thread', operator.is_not)])
 
@@ -39,6 +68,95 @@ class TestCached:
     def test_invalid_scope(self):
         with pytest.raises(ValueError):
             cached_call(self.func, 3.14, scope='invalid')
+        with pytest.raises(ValueError):
+            # Reported even if the arguments do not match the signature
+            cached_call(self.func, scope='invalid')
+
+    def test_argument_binding(self):
+        @cached
+        def func(x, y):
+            return x, y, random.random()
+
+        assert func(1, 2) is func(1, y=2) is func(x=1, y=2)
+        with pytest.raises(TypeError):
+            func(1)
+
+        def positional_only(x, /, y):
+            return x, y, random.random()
+
+        call = partial(cached_call, positional_only)
+        assert call(1, 2) is call(1, y=2)
+        with pytest.raises(TypeError):
+            call(x=1, y=2)
+
+    def test_hash_collision(self):
+        assert hash(-1) == hash(-2)
+        assert cached_call(self.func, -1) is not cached_call(self.func, -2)
+
+    def test_no_canonicalization(self):
+        def func(x, y=0):
+            return x, y, random.random()
+
+        call = partial(cached_call, func, canonicalize=False)
+        assert call(1, y=2) is call(1, y=2)
+        assert call(1, y=2) is not call(1, 2)
+        assert call([1], y={2: 3}) is call([1], y={2: 3})
+
+    @pytest.mark.parametrize("kwargs,canonicalized", [({}, True), ({'canonicalize': True}, True),
+                                                       ({'canonicalize': False}, False)])
+    def test_metaclass_canonicalization(self, kwargs, canonicalized):
+        class CachedClass(metaclass=Cached, **kwargs):
+            def __init__(self, x):
+                self.x = x
+
+        assert CachedClass(1) is CachedClass(1)
+        assert (CachedClass(1) is CachedClass(x=1)) == canonicalized
+
+    def test_bound_method(self, monkeypatch):
+        class HasMethods:
+            def plain(self, x):
+                return x, random.random()
+
+            def with_default(self, x, y=1):
+                return x, y, random.random()
+
+        # Signatures are computed only once, even though each access creates a new bound method
+        computed = []
+
+        def signature(fn):
+            computed.append(fn)
+            return real_signature(fn)
+
+        real_signature = inspect.signature
+        monkeypatch.setattr(inspect, 'signature', signature)
+        obj = HasMethods()
+        for method in ('plain', 'with_default'):
+            call = partial(cached_call, cache_name=f'test_bound_method_{method}')
+            assert call(getattr(obj, method), 1) is call(getattr(obj, method), x=1)
+            assert call(getattr(obj, method), 1) is not call(getattr(obj, method), 2)
+        assert sorted(fn.__name__ for fn in computed) == ['plain', 'with_default']
+
+    def test_arguments_hashed_once(self):
+        class CountsHashes:
+            count = 0
+
+            def __hash__(self):
+                CountsHashes.count += 1
+                return 0
+
+        arg = CountsHashes()
+        value = cached_call(self.func, arg)
+        CountsHashes.count = 0
+        assert cached_call(self.func, arg) is value
+        assert CountsHashes.count == 1
+
+    def test_unhashable_arguments(self):
+        def func(x, y):
+            return x, y, random.random()
+
+        shared = [1, {'a': 2}]
+        assert cached_call(func, shared, shared) is cached_call(func, [1, {'a': 2}], [1, {'a': 2}])
+        assert cached_call(func, shared, shared) is not cached_call(func, shared, [1, {'a': 3}])
 
     @staticmethod
     def check_callable(func, op):
@@ -108,6 +226,9 @@ class TestCachedProperty:
 
     def test_dependency(self):
         obj = self.HasCachedProperties(2.718)
+        # The dependency is not even set yet
+        without_x = object.__new__(self.HasCachedProperties)
+        assert not self.HasCachedProperties.depends_on_x.is_cache_valid(without_x)
         value = obj.depends_on_x
         assert obj.depends_on_x is value
         assert self.HasCachedProperties.depends_on_x.is_cache_valid(obj)
@@ -115,9 +236,53 @@ class TestCachedProperty:
         assert not self.HasCachedProperties.depends_on_x.is_cache_valid(obj)
         assert obj.depends_on_x is not value
 
+    def test_concurrent_access(self):
+        class SlowProperty:
+            calls = 0
+
+            @cached_property
+            def prop(self):
+                SlowProperty.calls += 1
+                time.sleep(0.05)
+                return random.random()
+
+        obj = SlowProperty()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(obj.prop)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert SlowProperty.calls == 1
+        assert len(set(results)) == 1
+        assert SlowProperty.prop.is_cache_valid(obj)
+
+    def test_no_reference_cycle(self):
+        class Value:
+            pass
+
+        class Owner:
+            @cached_property
+            def prop(self):
+                return Value()
+
+        obj = Owner()
+        ref = weakref.ref(obj.prop)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            del obj
+            assert ref() is None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
     def test_state(self):
         x = 4
         assert cached_property.state_without_cache(self.HasCachedProperties(x)) == {'x': x}
+        obj = self.HasCachedProperties(x)
+        assert obj.no_dependencies and obj.depends_on_x
+        assert cached_property.state_without_cache(obj) == {'x': x}
 
         class BaseWithState:
             def __init__(self, x):
@@ -141,6 +306,39 @@ class TestCachedProperty:
         y = 5
         assert HasCP(x, y).__getstate__() == {'x': x, 'y': y}
 
+    def test_multiple_dependencies(self):
+        class HasDependencies:
+            def __init__(self, x, y):
+                self.x = x
+                self.y = y
+
+            @cached_property('x', 'y')
+            def both(self):
+                return self.x, self.y, random.random()
+
+            @cached_property('x')
+            def only_x(self):
+                return self.x, random.random()
+
+        obj = HasDependencies((1, 2), 3)
+        both, only_x = obj.both, obj.only_x
+        assert obj.both is both and obj.only_x is only_x
+        obj.y = 4
+        assert obj.both is not both and obj.only_x is only_x
+        obj.x = (1, 2, 3)
+        assert obj.only_x is not only_x
+
+    def test_abstract(self):
+        class Abstract(abc.ABC):
+            @abc.abstractmethod
+            @cached_property
+            def prop(self):
+                ...
+
+        assert Abstract.__abstractmethods__ == {'prop'}
+        with pytest.raises(TypeError):
+            Abstract()
+
     @pytest.mark.timeout(5)
     def test_recursion(self):
         class RecursiveDependencies:
@@ -196,6 +394,7 @@ def test_pickled_cached_property(tmp_path):
     value = obj.prop
     filename = filename_template.format(x=obj.x)
     check_file(filename, ((x,), value))
+    assert HasPickledCachedProperty.prop.is_cache_valid(HasPickledCachedProperty(x))
     assert HasPickledCachedProperty(x).prop == value
 
     new_value = random.random()
@@ -207,6 +406,52 @@ def test_pickled_cached_property(tmp_path):
     assert not os.path.exists(filename)
 
 
+@pytest.mark.timeout(5)
+def test_pickled_cached_property_concurrent_delete(tmp_path, monkeypatch):
+    filename = str(tmp_path / "temp.pkl")
+
+    class HasPickledCachedProperty:
+        @pickled_cached_property(filename=filename)
+        def prop(self):
+            return 'value'
+
+    HasPickledCachedProperty().prop
+    obj = HasPickledCachedProperty()
+
+    # Pause the reader after it found the file, until the file is removed by the deleting thread
+    reading, removed = threading.Event(), threading.Event()
+
+    def paused_pload(*args, **kwargs):
+        reading.set()
+        removed.wait()
+        return pload(*args, **kwargs)
+
+    monkeypatch.setattr('epic.caching.property.pload', paused_pload)
+    results, errors = [], []
+
+    def read():
+        try:
+            results.append(obj.prop)
+        except Exception as exc:
+            errors.append(exc)
+
+    def delete():
+        del obj.prop
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    reading.wait()
+    deleter = threading.Thread(target=delete)
+    deleter.start()
+    while os.path.exists(filename):
+        time.sleep(0.01)
+    removed.set()
+    for t in (reader, deleter):
+        t.join()
+    assert not errors
+    assert results == ['value']
+
+
 def test_lazy_property():
     class HasLazyProperty:
         def __init__(self):